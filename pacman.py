@@ -1,9 +1,20 @@
 import sys
 import math
 import random
+import numpy as np
 import pygame
+import pygame.freetype
 from pygame import Rect
 
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional: without it the kernels below run as plain Python
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        return wrap
+
 # Game constants
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
@@ -72,11 +83,37 @@ COLS = len(MAZE_LAYOUT[0])
 
 # Determine tile size to fit within 800x600 while keeping aspect
 TILE_SIZE = min(SCREEN_WIDTH // COLS, SCREEN_HEIGHT // ROWS)
+# Round down to a power of two so pixel -> cell conversions are a shift
+TILE_SHIFT = TILE_SIZE.bit_length() - 1
+TILE_SIZE = 1 << TILE_SHIFT
 MAZE_WIDTH = COLS * TILE_SIZE
 MAZE_HEIGHT = ROWS * TILE_SIZE
 OFFSET_X = (SCREEN_WIDTH - MAZE_WIDTH) // 2
 OFFSET_Y = (SCREEN_HEIGHT - MAZE_HEIGHT) // 2
 
+# Flat per-cell lookup tables indexed as [row * COLS + col], built once so the
+# hot collision checks are a single byte lookup instead of string indexing.
+# Rows longer than COLS are clipped to match the playable grid.
+# One table per kind of mover: Pacman and normal ghosts are blocked by the
+# door 'H', eyes returning home pass through it.
+WALL_PAC = bytes(1 if ch in '1H' else 0 for row in MAZE_LAYOUT for ch in row[:COLS])
+WALL_GHOST = WALL_PAC
+WALL_EYES = bytes(1 if ch == '1' else 0 for row in MAZE_LAYOUT for ch in row[:COLS])
+
+# Live cell types are kept as the layout's ASCII codes in a uint8 grid
+EMPTY = ord('0')
+DOT = ord('2')
+POWER = ord('3')
+
+# Directions are small ints; DIR_VEC maps them to (dc, dr) steps and
+# REVERSE to the opposite direction
+DIR_NONE, DIR_RIGHT, DIR_LEFT, DIR_DOWN, DIR_UP = range(5)
+DIR_VEC = ((0, 0), (1, 0), (-1, 0), (0, 1), (0, -1))
+REVERSE = (DIR_NONE, DIR_LEFT, DIR_RIGHT, DIR_UP, DIR_DOWN)
+
+# Distance-field value for cells with no maze path to the source
+UNREACHABLE = np.iinfo(np.int16).max
+
 # Gameplay settings
 PACMAN_SPEED = 100  # pixels per second
 GHOST_SPEED = 90    # normal ghost speed
@@ -87,6 +124,10 @@ DOT_SCORE = 10
 POWER_SCORE = 50
 GHOST_SCORE = 200
 
+# Pellet sizes
+DOT_RADIUS = max(2, TILE_SIZE // 8)
+POWER_RADIUS = max(5, TILE_SIZE // 3)
+
 
 def grid_to_world(col, row):
     return OFFSET_X + col * TILE_SIZE + TILE_SIZE // 2, OFFSET_Y + row * TILE_SIZE + TILE_SIZE // 2
@@ -96,50 +137,105 @@ def rect_for_cell(col, row):
     return Rect(OFFSET_X + col * TILE_SIZE, OFFSET_Y + row * TILE_SIZE, TILE_SIZE, TILE_SIZE)
 
 
-def is_wall(col, row):
-    if 0 <= row < ROWS and 0 <= col < COLS:
-        return MAZE_LAYOUT[row][col] == '1' or MAZE_LAYOUT[row][col] == 'H'
-    return True
-
-
-def is_door(col, row):
-    if 0 <= row < ROWS and 0 <= col < COLS:
-        return MAZE_LAYOUT[row][col] == 'H'
-    return False
+# Static per-cell geometry, indexed like the bitmaps above
+CELL_RECTS = tuple(rect_for_cell(c, r) for r in range(ROWS) for c in range(COLS))
+CENTERS = tuple(grid_to_world(c, r) for r in range(ROWS) for c in range(COLS))
 
 
 def is_inside_grid(col, row):
     return 0 <= row < ROWS and 0 <= col < COLS
 
 
-def neighbors(col, row):
-    for dc, dr in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-        nc, nr = col + dc, row + dr
-        if is_inside_grid(nc, nr) and not is_wall(nc, nr):
-            yield (nc, nr)
+def legal_moves(wall):
+    # Per cell, the directions that stay inside the grid and off a wall
+    # bit, in the fixed order ghosts evaluate them
+    moves = []
+    for r in range(ROWS):
+        for c in range(COLS):
+            options = []
+            for d in (DIR_RIGHT, DIR_LEFT, DIR_DOWN, DIR_UP):
+                dc, dr = DIR_VEC[d]
+                nc, nr = c + dc, r + dr
+                if is_inside_grid(nc, nr) and not wall[nr * COLS + nc]:
+                    options.append(d)
+            moves.append(tuple(options))
+    return tuple(moves)
+
+
+# Legal moves per cell: MOVES (Pacman and normal ghosts) treats the door as
+# a wall, MOVES_EYES does not
+MOVES = legal_moves(WALL_GHOST)
+MOVES_EYES = legal_moves(WALL_EYES)
+
+
+def adjacency_table(moves):
+    # MOVES as a (ROWS * COLS, 4) array of neighbour indices padded with -1,
+    # the form the compiled BFS kernel can read
+    table = np.full((ROWS * COLS, 4), -1, dtype=np.int32)
+    for i, options in enumerate(moves):
+        for k, d in enumerate(options):
+            dc, dr = DIR_VEC[d]
+            table[i, k] = i + dr * COLS + dc
+    return table
+
+
+ADJACENCY = adjacency_table(MOVES)
+
+
+@njit(cache=True)
+def _bfs_kernel(start, adjacency):
+    # Flat BFS with an array FIFO (head/tail indices) so it compiles in nopython mode
+    count = adjacency.shape[0]
+    dist = np.full(count, UNREACHABLE, dtype=np.int16)
+    queue = np.empty(count, dtype=np.int32)
+    dist[start] = 0
+    queue[0] = start
+    head = 0
+    tail = 1
+    while head < tail:
+        i = queue[head]
+        head += 1
+        step = dist[i] + 1
+        for k in range(adjacency.shape[1]):
+            j = adjacency[i, k]
+            if j < 0:
+                break
+            if dist[j] == UNREACHABLE:
+                dist[j] = step
+                queue[tail] = j
+                tail += 1
+    return dist
+
+
+def bfs_from(col, row):
+    # Step distance from (col, row) to every cell over MOVES, as a
+    # (ROWS, COLS) grid; cells with no path hold UNREACHABLE
+    return _bfs_kernel(row * COLS + col, ADJACENCY).reshape(ROWS, COLS)
 
 
 class Entity:
     def __init__(self, col, row, color, radius):
         self.col = col
         self.row = row
-        x, y = grid_to_world(col, row)
+        x, y = CENTERS[row * COLS + col]
         self.x = float(x)
         self.y = float(y)
         self.color = color
         self.radius = radius
-        self.dir = (0, 0)
-        self.target_dir = (0, 0)
+        self.dir = DIR_NONE
+        self.target_dir = DIR_NONE
+        self._rect = Rect(0, 0, radius * 2, radius * 2)
 
-    @property
-    def rect(self):
-        return Rect(int(self.x - self.radius), int(self.y - self.radius), self.radius * 2, self.radius * 2)
+    def get_rect(self):
+        # The same Rect is reused and moved in place on every call
+        self._rect.topleft = (int(self.x) - self.radius, int(self.y) - self.radius)
+        return self._rect
 
     def grid_pos(self):
-        return (int((self.x - OFFSET_X) // TILE_SIZE), int((self.y - OFFSET_Y) // TILE_SIZE))
+        return ((int(self.x) - OFFSET_X) >> TILE_SHIFT, (int(self.y) - OFFSET_Y) >> TILE_SHIFT)
 
     def center_in_cell(self):
-        self.x, self.y = grid_to_world(self.col, self.row)
+        self.x, self.y = CENTERS[self.row * COLS + self.col]
 
 
 class Pacman(Entity):
@@ -148,41 +244,83 @@ class Pacman(Entity):
         self.lives = START_LIVES
         self.score = 0
         self.power_timer = 0.0
-
-    def set_direction(self, dc, dr):
-        self.target_dir = (dc, dr)
-
-    def update(self, dt, walls):
+        # Set only on the frame power_timer runs out
+        self.power_expired_this_frame = False
+        self._dist_cell = None
+        self._dist = None
+        # Flat index of the last cell _on_enter_cell ran for
+        self._entered = None
+
+    def distance_field(self):
+        # Maze distances from Pacman's cell, shared by all ghosts and only
+        # recomputed when Pacman enters a new cell
+        cell = (self.col, self.row)
+        if cell != self._dist_cell:
+            self._dist = bfs_from(*cell)
+            self._dist_cell = cell
+        return self._dist
+
+    def set_direction(self, direction):
+        self.target_dir = direction
+
+    def update(self, dt, pellets, _centers=CENTERS, _vec=DIR_VEC, _wall=WALL_PAC):
+        # Returns the pellet code eaten this frame (DOT or POWER), else None
         # Try to update direction when near center of a cell
-        cx, cy = grid_to_world(self.col, self.row)
+        cx, cy = _centers[self.row * COLS + self.col]
         if abs(self.x - cx) <= 2 and abs(self.y - cy) <= 2:
             # snap to center
             self.x, self.y = cx, cy
             self.dir = try_change_dir(self.col, self.row, self.target_dir)
 
         speed = PACMAN_SPEED
-        dx = self.dir[0] * speed * dt
-        dy = self.dir[1] * speed * dt
+        dc, dr = _vec[self.dir]
+        dx = dc * speed * dt
+        dy = dr * speed * dt
 
         # Move axis-aligned with collision against walls
         self.x += dx
-        if hits_wall(self.rect):
+        if hits_wall(self.get_rect(), _wall):
             # undo and stop x
             self.x -= dx
         self.y += dy
-        if hits_wall(self.rect):
+        if hits_wall(self.get_rect(), _wall):
             self.y -= dy
 
         # Update logical grid cell
-        self.col, self.row = self.grid_pos()
+        self.col = (int(self.x) - OFFSET_X) >> TILE_SHIFT
+        self.row = (int(self.y) - OFFSET_Y) >> TILE_SHIFT
 
         # Power timer decay
+        self.power_expired_this_frame = False
         if self.power_timer > 0:
             self.power_timer = max(0.0, self.power_timer - dt)
+            self.power_expired_this_frame = self.power_timer == 0
+
+        # Per-cell work runs once, on the frame Pacman enters a cell
+        cell = self.row * COLS + self.col
+        if cell != self._entered:
+            self._entered = cell
+            return self._on_enter_cell(pellets)
+        return None
+
+    def _on_enter_cell(self, pellets):
+        # Eat the dot or power pellet in the cell just entered
+        code = pellets[self.row, self.col]
+        if code == DOT:
+            pellets[self.row, self.col] = EMPTY
+            self.score += DOT_SCORE
+            return DOT
+        if code == POWER:
+            pellets[self.row, self.col] = EMPTY
+            self.score += POWER_SCORE
+            self.power_timer = POWER_DURATION
+            self.power_expired_this_frame = False
+            return POWER
+        return None
 
     def draw(self, surface):
         # Simple pacman circle. Optionally animate mouth by direction
-        pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), self.radius)
+        return pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), self.radius)
 
 
 class Ghost(Entity):
@@ -195,24 +333,30 @@ class Ghost(Entity):
         self.mode = 'normal'
         self.behavior = behavior  # 'chase' or 'random'
         self.flash_timer = 0.0
+        # (ghost cell, Pacman cell) of the last direction decision
+        self._decided_at = None
 
     def set_vulnerable(self):
         if self.mode != 'eyes':
             self.mode = 'vulnerable'
             self.flash_timer = 0.0
+            self._decided_at = None
 
     def set_normal(self):
         self.mode = 'normal'
+        self._decided_at = None
 
     def set_eyes(self):
         self.mode = 'eyes'
+        self._decided_at = None
 
     def speed(self):
         if self.mode == 'vulnerable':
             return VULNERABLE_SPEED
         return GHOST_SPEED
 
-    def update(self, dt, pacman):
+    def update(self, dt, pacman, _centers=CENTERS, _moves=MOVES, _vec=DIR_VEC, _reverse=REVERSE,
+               _wall=WALL_GHOST):
         # If eyes, path back to home
         if self.mode == 'eyes':
             target = self.home
@@ -225,156 +369,144 @@ class Ghost(Entity):
             return
 
         # At cell center, maybe decide new direction
-        cx, cy = grid_to_world(self.col, self.row)
+        cx, cy = _centers[self.row * COLS + self.col]
         at_center = abs(self.x - cx) <= 2 and abs(self.y - cy) <= 2
         if at_center:
             self.x, self.y = cx, cy
-            options = []
-            for d in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-                nc, nr = self.col + d[0], self.row + d[1]
-                if not is_wall(nc, nr):
-                    # avoid reversing unless no other option
-                    if (-d[0], -d[1]) != self.dir or len(options) == 0:
-                        options.append(d)
-            chosen = self._choose_dir(options, pacman)
-            self.dir = chosen
+            # In a static maze the choice can only change once the ghost or
+            # Pacman has moved to another cell, so keep the current heading
+            decision = (self.col, self.row, pacman.col, pacman.row)
+            if self.dir == DIR_NONE or decision != self._decided_at:
+                # avoid reversing unless no other option
+                moves = _moves[self.row * COLS + self.col]
+                back = _reverse[self.dir]
+                options = list(moves[:1]) + [d for d in moves[1:] if d != back]
+                self.dir = self._choose_dir(options, pacman)
+                self._decided_at = decision
+
+        # Stuck against a wall: nothing to move or collide
+        if self.dir == DIR_NONE:
+            return
 
         # Move
         speed = self.speed()
-        dx = self.dir[0] * speed * dt
-        dy = self.dir[1] * speed * dt
+        dc, dr = _vec[self.dir]
+        dx = dc * speed * dt
+        dy = dr * speed * dt
         self.x += dx
-        if hits_wall(self.rect):
+        if hits_wall(self.get_rect(), _wall):
             self.x -= dx
-            self.dir = (0, 0)
+            self.dir = DIR_NONE
         self.y += dy
-        if hits_wall(self.rect):
+        if hits_wall(self.get_rect(), _wall):
             self.y -= dy
-            self.dir = (0, 0)
-        self.col, self.row = self.grid_pos()
+            self.dir = DIR_NONE
+        self.col = (int(self.x) - OFFSET_X) >> TILE_SHIFT
+        self.row = (int(self.y) - OFFSET_Y) >> TILE_SHIFT
 
     def _choose_dir(self, options, pacman):
         if not options:
-            return (0, 0)
+            return DIR_NONE
+        if self.behavior == 'random' and self.mode != 'vulnerable':
+            return random.choice(options)
+        dist = pacman.distance_field()
+        if dist[self.row, self.col] == UNREACHABLE:
+            # No maze path to Pacman: fall back to straight-line distance
+            def score(d):
+                dc, dr = DIR_VEC[d]
+                return (self.col + dc - pacman.col) ** 2 + (self.row + dr - pacman.row) ** 2
+        else:
+            def score(d):
+                dc, dr = DIR_VEC[d]
+                return dist[self.row + dr, self.col + dc]
         if self.mode == 'vulnerable':
             # move away from Pacman: maximize distance
-            best = None
-            best_dist = -1
-            for d in options:
-                nc, nr = self.col + d[0], self.row + d[1]
-                dist = (nc - pacman.col) ** 2 + (nr - pacman.row) ** 2
-                if dist > best_dist:
-                    best_dist = dist
-                    best = d
-            return best
-        if self.behavior == 'random':
-            return random.choice(options)
+            return max(options, key=score)
         # chase behavior: minimize distance to Pacman
-        best = None
-        best_dist = 1e9
-        for d in options:
-            nc, nr = self.col + d[0], self.row + d[1]
-            dist = (nc - pacman.col) ** 2 + (nr - pacman.row) ** 2
-            if dist < best_dist:
-                best_dist = dist
-                best = d
-        return best
-
-    def _move_towards(self, dt, target_cell):
+        return min(options, key=score)
+
+    def _move_towards(self, dt, target_cell, _wall=WALL_EYES):
         tx, ty = target_cell
         # Simple greedy movement to home
-        options = []
-        for d in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-            nc, nr = self.col + d[0], self.row + d[1]
-            # Eyes can pass through door 'H'
-            if is_inside_grid(nc, nr) and MAZE_LAYOUT[nr][nc] != '1':
-                options.append(d)
+        # Eyes can pass through door 'H' (MOVES_EYES and WALL_EYES)
+        options = MOVES_EYES[self.row * COLS + self.col]
         if options:
             best = None
             best_dist = 1e9
             for d in options:
-                nc, nr = self.col + d[0], self.row + d[1]
+                dc, dr = DIR_VEC[d]
+                nc, nr = self.col + dc, self.row + dr
                 dist = (nc - tx) ** 2 + (nr - ty) ** 2
                 if dist < best_dist:
                     best_dist = dist
                     best = d
             self.dir = best
         speed = GHOST_SPEED + 30
-        dx = self.dir[0] * speed * dt
-        dy = self.dir[1] * speed * dt
+        dc, dr = DIR_VEC[self.dir]
+        dx = dc * speed * dt
+        dy = dr * speed * dt
         self.x += dx
-        if hits_wall_eyes(self.rect):
+        if hits_wall(self.get_rect(), _wall):
             self.x -= dx
-            self.dir = (0, 0)
+            self.dir = DIR_NONE
         self.y += dy
-        if hits_wall_eyes(self.rect):
+        if hits_wall(self.get_rect(), _wall):
             self.y -= dy
-            self.dir = (0, 0)
-        self.col, self.row = self.grid_pos()
+            self.dir = DIR_NONE
+        self.col = (int(self.x) - OFFSET_X) >> TILE_SHIFT
+        self.row = (int(self.y) - OFFSET_Y) >> TILE_SHIFT
 
     def draw(self, surface, t):
+        # Returns the area touched so the caller can track dirty rects
         if self.mode == 'vulnerable':
             # flash near end of power timer
             color = VULN_BLUE if int(t * 6) % 2 == 0 else WHITE
-            pygame.draw.circle(surface, color, (int(self.x), int(self.y)), self.radius)
+            return pygame.draw.circle(surface, color, (int(self.x), int(self.y)), self.radius)
         elif self.mode == 'eyes':
-            pygame.draw.circle(surface, WHITE, (int(self.x), int(self.y)), self.radius)
-            pygame.draw.circle(surface, BLUE, (int(self.x) - 4, int(self.y) - 2), 3)
-            pygame.draw.circle(surface, BLUE, (int(self.x) + 4, int(self.y) - 2), 3)
+            area = pygame.draw.circle(surface, WHITE, (int(self.x), int(self.y)), self.radius)
+            return area.unionall([
+                pygame.draw.circle(surface, BLUE, (int(self.x) - 4, int(self.y) - 2), 3),
+                pygame.draw.circle(surface, BLUE, (int(self.x) + 4, int(self.y) - 2), 3),
+            ])
         else:
-            pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), self.radius)
+            return pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), self.radius)
 
 
 def try_change_dir(col, row, target_dir):
-    dc, dr = target_dir
-    if dc == 0 and dr == 0:
-        return (0, 0)
-    nc, nr = col + dc, row + dr
-    if not is_wall(nc, nr):
-        return (dc, dr)
-    return (0, 0)
-
-
-def hits_wall(rect):
-    # Check against wall cells only
-    # Expand check by overlapping rect with tiles
-    left = max(0, (rect.left - OFFSET_X) // TILE_SIZE)
-    right = min(COLS - 1, (rect.right - 1 - OFFSET_X) // TILE_SIZE)
-    top = max(0, (rect.top - OFFSET_Y) // TILE_SIZE)
-    bottom = min(ROWS - 1, (rect.bottom - 1 - OFFSET_Y) // TILE_SIZE)
-    for r in range(int(top), int(bottom) + 1):
-        for c in range(int(left), int(right) + 1):
-            if MAZE_LAYOUT[r][c] == '1' or MAZE_LAYOUT[r][c] == 'H':
-                if rect.colliderect(rect_for_cell(c, r)):
-                    return True
+    if target_dir in MOVES[row * COLS + col]:
+        return target_dir
+    return DIR_NONE
+
+
+@njit(cache=True)
+def _hits_wall_kernel(left, top, right, bottom, wall):
+    # Check against wall cells only.
+    # Entities are smaller than a tile, so the rect covers at most 2x2 cells,
+    # and every cell in the covered range overlaps it: a wall bit anywhere in
+    # that range is a hit without a per-tile colliderect.
+    c0 = max(0, (left - OFFSET_X) >> TILE_SHIFT)
+    c1 = min(COLS - 1, (right - 1 - OFFSET_X) >> TILE_SHIFT)
+    r0 = max(0, (top - OFFSET_Y) >> TILE_SHIFT)
+    r1 = min(ROWS - 1, (bottom - 1 - OFFSET_Y) >> TILE_SHIFT)
+    for r in range(r0, r1 + 1):
+        base = r * COLS
+        for c in range(c0, c1 + 1):
+            if wall[base + c]:
+                return True
     return False
 
 
-def hits_wall_eyes(rect):
-    # Eyes phase can go through 'H' door
-    left = max(0, (rect.left - OFFSET_X) // TILE_SIZE)
-    right = min(COLS - 1, (rect.right - 1 - OFFSET_X) // TILE_SIZE)
-    top = max(0, (rect.top - OFFSET_Y) // TILE_SIZE)
-    bottom = min(ROWS - 1, (rect.bottom - 1 - OFFSET_Y) // TILE_SIZE)
-    for r in range(int(top), int(bottom) + 1):
-        for c in range(int(left), int(right) + 1):
-            if MAZE_LAYOUT[r][c] == '1':
-                if rect.colliderect(rect_for_cell(c, r)):
-                    return True
-    return False
+def hits_wall(rect, wall=WALL_PAC):
+    # wall is WALL_PAC, WALL_GHOST or WALL_EYES depending on who is moving
+    return _hits_wall_kernel(rect.left, rect.top, rect.right, rect.bottom, wall)
 
 
 def load_dots():
-    dots = set()
-    power = set()
-    for r in range(ROWS):
-        for c in range(COLS):
-            ch = MAZE_LAYOUT[r][c]
-            if ch == '2':
-                dots.add((c, r))
-            elif ch == '3':
-                power.add((c, r))
-    return dots, power
+    # Returns a fresh (ROWS, COLS) grid of cell codes and the pellet count
+    pellets = np.frombuffer(''.join(row[:COLS] for row in MAZE_LAYOUT).encode(), dtype=np.uint8)
+    pellets = pellets.reshape(ROWS, COLS).copy()
+    remaining = int(np.count_nonzero((pellets == DOT) | (pellets == POWER)))
+    return pellets, remaining
 
 
 def draw_maze(surface):
@@ -384,7 +516,7 @@ def draw_maze(surface):
     for r in range(ROWS):
         for c in range(COLS):
             cell = MAZE_LAYOUT[r][c]
-            rect = rect_for_cell(c, r)
+            rect = CELL_RECTS[r * COLS + c]
             if cell == '1':
                 pygame.draw.rect(surface, BLUE, rect)
             elif cell == 'H':
@@ -395,48 +527,40 @@ def draw_maze(surface):
     #         pygame.draw.rect(surface, (20, 20, 20), rect_for_cell(c, r), 1)
 
 
-def draw_dots(surface, dots, power):
-    for (c, r) in dots:
-        x, y = grid_to_world(c, r)
-        pygame.draw.circle(surface, WHITE, (x, y), max(2, TILE_SIZE // 8))
-    for (c, r) in power:
-        x, y = grid_to_world(c, r)
-        pygame.draw.circle(surface, WHITE, (x, y), max(5, TILE_SIZE // 3))
+def create_pellet_sprites():
+    # Render each pellet type once; per cell, keep the ready-made
+    # (surface, topleft) pair so draw_dots can hand them straight to blits
+    sprites = {}
+    for code, radius in ((DOT, DOT_RADIUS), (POWER, POWER_RADIUS)):
+        surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, WHITE, (radius, radius), radius)
+        sprites[code] = tuple((surf, (x - radius, y - radius)) for x, y in CENTERS)
+    return sprites
 
 
-def handle_pacman_eats(pacman, dots, power):
-    # Eat dot or power pellet when centered in a cell
-    cell = (pacman.col, pacman.row)
-    ate = False
-    if cell in dots:
-        dots.remove(cell)
-        pacman.score += DOT_SCORE
-        ate = True
-    if cell in power:
-        power.remove(cell)
-        pacman.score += POWER_SCORE
-        pacman.power_timer = POWER_DURATION
-        ate = True
-    return ate
+def draw_dots(surface, pellets, sprites):
+    cells = pellets.ravel()
+    dot_blits = sprites[DOT]
+    power_blits = sprites[POWER]
+    batch = [dot_blits[i] for i in np.flatnonzero(cells == DOT)]
+    batch += [power_blits[i] for i in np.flatnonzero(cells == POWER)]
+    surface.blits(batch, doreturn=False)
 
 
 def check_collisions(pacman, ghosts):
-    pac_rect = pacman.rect
-    result = []
-    for g in ghosts:
-        if pac_rect.colliderect(g.rect):
-            result.append(g)
-    return result
+    # One native scan over all ghost rects instead of a colliderect per ghost
+    hit_idxs = pacman.get_rect().collidelistall([g.get_rect() for g in ghosts])
+    return [ghosts[i] for i in hit_idxs]
 
 
 def reset_positions(pacman, ghosts):
     pacman.center_in_cell()
-    pacman.dir = (0, 0)
-    pacman.target_dir = (0, 0)
+    pacman.dir = DIR_NONE
+    pacman.target_dir = DIR_NONE
     for g in ghosts:
         g.col, g.row = g.spawn
         g.center_in_cell()
-        g.dir = (0, 0)
+        g.dir = DIR_NONE
         g.set_normal()
 
 
@@ -471,13 +595,48 @@ def create_ghosts():
     return ghosts
 
 
-def draw_hud(surface, font, pacman, remaining):
-    score_surf = font.render(f"Score: {pacman.score}", True, WHITE)
-    lives_surf = font.render(f"Lives: {pacman.lives}", True, WHITE)
-    dots_surf = font.render(f"Dots left: {remaining}", True, WHITE)
-    surface.blit(score_surf, (10, 10))
-    surface.blit(lives_surf, (10, 10 + score_surf.get_height() + 4))
-    surface.blit(dots_surf, (10, 10 + score_surf.get_height() + lives_surf.get_height() + 8))
+class HudCache:
+    # Remembers the value and screen area of each HUD line so a line is only
+    # erased and redrawn when its value changes
+    def __init__(self, font):
+        self.font = font
+        self.values = {}
+        self.rects = {}
+
+    def invalidate(self):
+        # The screen was repainted: every line must be drawn again
+        self.values.clear()
+        self.rects.clear()
+
+    def draw(self, surface, board, label, value, pos):
+        if self.values.get(label) == value:
+            return []
+        changed = []
+        old = self.rects.get(label)
+        if old is not None:
+            surface.blit(board, old, old)
+            changed.append(old)
+        rect = self.font.render_to(surface, pos, f"{label}: {value}", WHITE)
+        self.values[label] = value
+        self.rects[label] = rect
+        changed.append(rect)
+        return changed
+
+
+def draw_hud(surface, board, hud, pacman, remaining):
+    # Returns the areas that changed on screen
+    line = hud.font.get_sized_height()
+    changed = hud.draw(surface, board, "Score", pacman.score, (10, 10))
+    changed += hud.draw(surface, board, "Lives", pacman.lives, (10, 10 + line + 4))
+    changed += hud.draw(surface, board, "Dots left", remaining, (10, 10 + 2 * line + 8))
+    return changed
+
+
+def create_board(maze_bg, pellets, sprites):
+    # Maze plus live pellets: everything static between two eats
+    board = maze_bg.copy()
+    draw_dots(board, pellets, sprites)
+    return board
 
 
 def main():
@@ -485,7 +644,15 @@ def main():
     pygame.display.set_caption("Pacman - Pygame")
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     clock = pygame.time.Clock()
-    font = pygame.font.SysFont(None, 28)
+    # freetype draws text straight onto the target surface. pygame.font scales
+    # its default font by 0.6875, so size 19 matches the old SysFont(None, 28)
+    font = pygame.freetype.SysFont(None, 19)
+    hud = HudCache(font)
+    pellet_sprites = create_pellet_sprites()
+
+    # The maze never changes: render it once and blit it as the background
+    maze_bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    draw_maze(maze_bg)
 
     # Initialize game state
     # Find a starting position for Pacman (first corridor cell near bottom center)
@@ -499,45 +666,70 @@ def main():
             start_col = c
             break
     pacman = Pacman(start_col, start_row)
-    dots, power = load_dots()
+    pellets, remaining = load_dots()
     ghosts = create_ghosts()
 
+    # Warm up the compiled kernels so the first frame doesn't pay for the JIT
+    hits_wall(pacman.get_rect())
+    pacman.distance_field()
+
+    # Dirty-rect rendering: only areas drawn last frame, plus eaten pellets,
+    # are restored from the board and pushed to the display
+    board = create_board(maze_bg, pellets, pellet_sprites)
+    redraw_all = True
+    drawn = []
+
     running = True
     game_over = False
     win = False
 
+    # Hoist names used every frame into locals (LOAD_FAST instead of
+    # module and attribute lookups in the loop)
+    tick = clock.tick
+    event_get = pygame.event.get
+    get_ticks = pygame.time.get_ticks
+    update_display = pygame.display.update
+    blit = screen.blit
+    QUIT, KEYDOWN = pygame.QUIT, pygame.KEYDOWN
+    K_ESCAPE, K_r = pygame.K_ESCAPE, pygame.K_r
+    key_dirs = {
+        pygame.K_LEFT: DIR_LEFT,
+        pygame.K_RIGHT: DIR_RIGHT,
+        pygame.K_UP: DIR_UP,
+        pygame.K_DOWN: DIR_DOWN,
+    }
+    cell_rects = CELL_RECTS
+
     while running:
-        dt = clock.tick(FPS) / 1000.0
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        dt = tick(FPS) / 1000.0
+        eaten = []
+        for event in event_get():
+            if event.type == QUIT:
                 running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
+            elif event.type == KEYDOWN:
+                if event.key == K_ESCAPE:
                     running = False
                 if game_over or win:
-                    if event.key == pygame.K_r:
+                    if event.key == K_r:
                         # reset game
                         pacman = Pacman(start_col, start_row)
-                        dots, power = load_dots()
+                        pellets, remaining = load_dots()
                         ghosts = create_ghosts()
+                        board = create_board(maze_bg, pellets, pellet_sprites)
+                        redraw_all = True
                         game_over = False
                         win = False
                         continue
-                if event.key == pygame.K_LEFT:
-                    pacman.set_direction(-1, 0)
-                elif event.key == pygame.K_RIGHT:
-                    pacman.set_direction(1, 0)
-                elif event.key == pygame.K_UP:
-                    pacman.set_direction(0, -1)
-                elif event.key == pygame.K_DOWN:
-                    pacman.set_direction(0, 1)
+                if event.key in key_dirs:
+                    pacman.set_direction(key_dirs[event.key])
 
         if not (game_over or win):
-            # Update pacman
-            pacman.update(dt, None)
-
-            # Eat dots/power
-            if handle_pacman_eats(pacman, dots, power):
+            # Update pacman; it eats whatever is in a cell on entering it
+            if pacman.update(dt, pellets) is not None:
+                remaining -= 1
+                cell_rect = cell_rects[pacman.row * COLS + pacman.col]
+                board.blit(maze_bg, cell_rect, cell_rect)
+                eaten.append(cell_rect)
                 # Set ghosts vulnerable when power pellet eaten
                 if pacman.power_timer > 0:
                     for g in ghosts:
@@ -548,7 +740,7 @@ def main():
                 g.update(dt, pacman)
 
             # Toggle ghosts back to normal when power ends
-            if pacman.power_timer == 0:
+            if pacman.power_expired_this_frame:
                 for g in ghosts:
                     if g.mode == 'vulnerable':
                         g.set_normal()
@@ -568,27 +760,38 @@ def main():
                     break
 
             # Win condition
-            if len(dots) + len(power) == 0:
+            if remaining == 0:
                 win = True
 
         # Draw
-        draw_maze(screen)
-        draw_dots(screen, dots, power)
-        pacman.draw(screen)
-        t = pygame.time.get_ticks() / 1000.0
+        if redraw_all:
+            blit(board, (0, 0))
+            dirty = [screen.get_rect()]
+            hud.invalidate()
+            redraw_all = False
+        else:
+            dirty = drawn + eaten
+            for rect in dirty:
+                blit(board, rect, rect)
+        drawn = [pacman.draw(screen)]
+        t = get_ticks() / 1000.0
         for g in ghosts:
-            g.draw(screen, t)
-        draw_hud(screen, font, pacman, len(dots) + len(power))
+            drawn.append(g.draw(screen, t))
+        # The HUD sits beside the maze, so it stays on screen until it changes
+        dirty += draw_hud(screen, board, hud, pacman, remaining)
 
         # Messages
+        message = None
         if game_over:
-            msg = font.render("Game Over! Press R to Restart or ESC to Quit", True, WHITE)
-            screen.blit(msg, (SCREEN_WIDTH // 2 - msg.get_width() // 2, SCREEN_HEIGHT // 2 - msg.get_height() // 2))
+            message = "Game Over! Press R to Restart or ESC to Quit"
         elif win:
-            msg = font.render("You Win! Press R to Restart or ESC to Quit", True, WHITE)
-            screen.blit(msg, (SCREEN_WIDTH // 2 - msg.get_width() // 2, SCREEN_HEIGHT // 2 - msg.get_height() // 2))
+            message = "You Win! Press R to Restart or ESC to Quit"
+        if message:
+            msg_rect = font.get_rect(message)
+            msg_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+            drawn.append(font.render_to(screen, msg_rect, message, WHITE))
 
-        pygame.display.flip()
+        update_display(dirty + drawn)
 
     pygame.quit()
     sys.exit()